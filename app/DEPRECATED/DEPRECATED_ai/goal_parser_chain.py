@@ -566,26 +566,17 @@ def _validate_plan_dates(plan_data) -> list[str]:
 
 def _validate_plan_tasks(plan_data) -> list[str]:
     """Validate overall task structure and consistency."""
-    issues = []
-    
-    total_tasks = 0
-    
-    # Count tasks in habit cycles
-    if hasattr(plan_data, 'habit_cycles') and plan_data.habit_cycles:
-        for cycle in plan_data.habit_cycles:
-            if hasattr(cycle, 'occurrences') and cycle.occurrences:
-                for occurrence in cycle.occurrences:
-                    if hasattr(occurrence, 'tasks') and occurrence.tasks:
-                        total_tasks += len(occurrence.tasks)
-    
-    # Count project tasks
-    if hasattr(plan_data, 'tasks') and plan_data.tasks:
-        total_tasks += len(plan_data.tasks)
-    
-    if total_tasks == 0:
-        issues.append("Plan has no tasks defined")
-    
-    return issues
+    # Only "no tasks at all" is reported, so stop at the first task found
+    # instead of counting every task in every occurrence.
+    if getattr(plan_data, 'tasks', None):
+        return []
+
+    for cycle in getattr(plan_data, 'habit_cycles', None) or []:
+        for occurrence in getattr(cycle, 'occurrences', None) or []:
+            if getattr(occurrence, 'tasks', None):
+                return []
+
+    return ["Plan has no tasks defined"]
 
 
 # ✅ NEW: Generate plan with validation function
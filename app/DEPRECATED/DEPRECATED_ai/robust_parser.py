@@ -43,6 +43,9 @@ class RobustParser:
         
         failed_fields_history = set()  # Track fields that have failed before
         last_output = llm_output  # Track output changes
+        # Reuse the model's compiled core validator across retries instead of
+        # going through the BaseModel.__init__ kwargs path each attempt
+        validator = target_model.__pydantic_validator__
         
         for attempt in range(self.max_retries + 1):
             try:
@@ -54,7 +57,7 @@ class RobustParser:
                     raise ValueError("Invalid JSON format")
                 
                 # Validate against the target model
-                result = target_model(**parsed_data)
+                result = validator.validate_python(parsed_data)
                 logger.info("✅ ROBUST PARSER: Parsing successful")
                 return result
                 
@@ -13,10 +13,11 @@ Each tool exposes `prerequisites` and `produces` metadata for controller checks.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Union, cast
 from uuid import uuid4
 from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel, Field
+import heapq
 import os
 import time
 
@@ -28,6 +29,8 @@ from app.cognitive.contracts.types import (
     PlanContext,
     StrategyProfile,
     NodeStatus,
+    Roadmap,
+    Schedule,
 )
 from app.cognitive.contracts.schema_models import (
     PatternSpecSchema,
@@ -66,6 +69,13 @@ def _get_chat_model():
         return None
 
 
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Accept either a contract model or its dumped dict; tools work on JSON-safe dicts internally."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value or {}
+
+
 def _strip_code_fences(text: str) -> str:
     t = text.strip()
     if t.startswith("```") and t.endswith("```"):
@@ -621,6 +631,8 @@ class OptionCrafterTool:
 # Minimal deterministic implementations (no LLM)
 # ─────────────────────────────────────────────────────────────
 
+# The *Input models double as the LLM-facing args_schema, so they keep plain
+# dict fields; in-process callers holding models use the run_from_* methods.
 class RoadmapBuilderInput(BaseModel):
     outline: Dict[str, Any]  # Expect PlanOutline.model_dump()
     roadmap_context: Optional[Dict[str, Any]] = None
@@ -634,9 +646,25 @@ class RoadmapBuilderTool:
     produces: List[str] = ["roadmap"]
 
     def run(self, params: RoadmapBuilderInput) -> ToolResult:
+        return self.run_from_outline(params.outline, params.roadmap_context)
+
+    def run_json(self, raw: Union[str, bytes], roadmap_context: Optional[Dict[str, Any]] = None) -> ToolResult:
+        """Build from a raw PlanOutline JSON payload (e.g. LLM output), parsing and validating in one pass."""
+        try:
+            outline = PlanOutline.model_validate_json(raw)
+        except Exception as e:
+            return ToolResult(ok=False, confidence=0.0, explanations=[f"roadmap_builder_error: {e}"], data={})
+        return self.run_from_outline(outline, roadmap_context)
+
+    def run_from_outline(
+        self,
+        outline: Union[PlanOutline, Dict[str, Any]],
+        roadmap_context: Optional[Dict[str, Any]] = None,
+    ) -> ToolResult:
+        """Fast path for in-process callers that already hold an outline; skips RoadmapBuilderInput."""
         # Minimal transformation: mirror outline nodes into a Roadmap-like dict
-        outline = params.outline or {}
         try:
+            outline = _as_dict(outline)
             root_id = outline.get("root_id") or str(uuid4())
             nodes = outline.get("nodes") or []
             # Ensure nodes at least has a root goal for validity downstream
@@ -657,7 +685,7 @@ class RoadmapBuilderTool:
                     }
                 ]
                 root_id = nodes[0]["id"]
-            roadmap_context = params.roadmap_context or {"scope": "auto", "cadence": "weekly"}
+            roadmap_context = roadmap_context or {"scope": "auto", "cadence": "weekly"}
             data = {
                 "root_id": root_id,
                 "roadmap_context": roadmap_context,
@@ -684,9 +712,18 @@ class ScheduleGeneratorTool:
     produces: List[str] = ["schedule"]
 
     def run(self, params: ScheduleGeneratorInput) -> ToolResult:
+        return self.run_from_roadmap(params.roadmap, params.start_time, params.block_minutes)
+
+    def run_from_roadmap(
+        self,
+        roadmap: Union[Roadmap, Dict[str, Any]],
+        start_time: Optional[datetime] = None,
+        block_minutes: int = 60,
+    ) -> ToolResult:
+        """Fast path for in-process callers that already hold a roadmap; skips ScheduleGeneratorInput."""
         try:
-            tznow = params.start_time or datetime.now(timezone.utc)
-            roadmap = params.roadmap or {}
+            tznow = start_time or datetime.now(timezone.utc)
+            roadmap = _as_dict(roadmap)
             nodes = roadmap.get("nodes", [])
             # Pick up to 3 task-like nodes to schedule
             task_nodes = [n for n in nodes if n.get("node_type") in ("task", "sub_task")]
@@ -696,15 +733,15 @@ class ScheduleGeneratorTool:
             blocks = []
             t = tznow
             for i, n in enumerate(task_nodes[:3]):
-                start = t + timedelta(minutes=i * params.block_minutes)
-                end = start + timedelta(minutes=params.block_minutes)
+                start = t + timedelta(minutes=i * block_minutes)
+                end = start + timedelta(minutes=block_minutes)
                 blocks.append(
                     {
                         "plan_node_id": n.get("id", str(uuid4())),
                         "title": n.get("title", f"Task {i+1}"),
                         "start": start.isoformat(),
                         "end": end.isoformat(),
-                        "estimated_minutes": params.block_minutes,
+                        "estimated_minutes": block_minutes,
                         "tags": ["auto"],
                         "notes": "stub block",
                     }
@@ -719,6 +756,38 @@ class PortfolioProbeInput(BaseModel):
     world_model: Optional[Dict[str, Any]] = None
 
 
+def _block_time(value: Any) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _detect_conflicts_sweep(blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Report every overlapping pair of blocks in O(n log n + k).
+
+    Blocks are swept in start order while a min-heap holds the ends of blocks
+    still open; anything left on the heap after expiring ends <= start overlaps
+    the current block.
+    """
+    spans = sorted(
+        ((_block_time(b["start"]), _block_time(b["end"]), b.get("plan_node_id")) for b in blocks),
+        key=lambda span: span[0],
+    )
+    conflicts: List[Dict[str, Any]] = []
+    open_blocks: List[Any] = []  # heap of (end, seq, plan_node_id)
+    for seq, (start, end, node_id) in enumerate(spans):
+        while open_blocks and open_blocks[0][0] <= start:
+            heapq.heappop(open_blocks)
+        for other_end, _, other_id in open_blocks:
+            overlap = min(end, other_end) - start
+            conflicts.append(
+                {
+                    "plan_node_ids": [str(other_id), str(node_id)],
+                    "overlap_minutes": int(overlap.total_seconds() // 60),
+                }
+            )
+        heapq.heappush(open_blocks, (end, seq, node_id))
+    return conflicts
+
+
 class PortfolioProbeTool:
     name = "portfolio_probe"
     description = "Check schedule for simple conflicts/utilization (stub)"
@@ -726,17 +795,22 @@ class PortfolioProbeTool:
     produces: List[str] = ["portfolio_check"]
 
     def run(self, params: PortfolioProbeInput) -> ToolResult:
-        # Minimal check: ensure no overlapping blocks in naive sequence
+        return self.run_from_schedule(params.schedule)
+
+    def run_from_schedule(self, schedule: Union[Schedule, Dict[str, Any]]) -> ToolResult:
+        """Fast path for in-process callers that already hold a schedule; skips PortfolioProbeInput."""
+        # Minimal check: overlapping blocks within the schedule, plus total utilization
         try:
-            blocks = params.schedule.get("blocks", [])
-            # Since we create sequential blocks, assume no conflicts
+            blocks = _as_dict(schedule).get("blocks", [])
+            conflicts = _detect_conflicts_sweep(blocks)
             utilization = sum(b.get("estimated_minutes", 60) for b in blocks)
             data = {
-                "conflicts": [],
+                "conflicts": conflicts,
                 "utilization_minutes": utilization,
-                "notes": "naive non-overlapping sequence (stub)",
+                "notes": "intra-schedule overlap sweep (stub)",
             }
-            return ToolResult(ok=True, confidence=0.7, explanations=["No conflicts detected (stub)."], data=data)
+            explanation = f"{len(conflicts)} overlapping block pair(s) detected." if conflicts else "No conflicts detected."
+            return ToolResult(ok=True, confidence=0.7, explanations=[explanation], data=data)
         except Exception as e:
             return ToolResult(ok=False, confidence=0.0, explanations=[f"portfolio_probe_error: {e}"], data={})
 
@@ -828,6 +902,8 @@ class SemanticCriticTool:
                 "artifact": params.artifact,
                 "plan_context": params.plan_context or {},
             }
+            # Serialize once; the same string is logged by size and sent to the model
+            payload_json = json.dumps(payload, ensure_ascii=False, default=str)
 
             self.logger.info("critique_starting",
                 operation_id=operation_id,
@@ -835,13 +911,13 @@ class SemanticCriticTool:
                 artifact_keys=list(params.artifact.keys()) if isinstance(params.artifact, dict) else "non_dict",
                 pattern_type=params.selected_pattern.get("pattern_type") if params.selected_pattern else None,
                 ontology_keys=list(params.ontology.keys()) if params.ontology else [],
-                payload_size=len(json.dumps(payload, default=str))
+                payload_size=len(payload_json)
             )
 
             # Expect strict JSON verdict {ok, confidence, issues[], repair_hints[]}
             msgs = [
                 ("system", sys_prompt + " Respond with a single JSON object only."),
-                ("user", json.dumps(payload, ensure_ascii=False, default=str)),
+                ("user", payload_json),
             ]
             
             tries = 0
@@ -8,7 +8,10 @@ from __future__ import annotations
 # app/cognitive/brain/intent_registry_routes.py
 
 from __future__ import annotations
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+from app.config.feature_flags import is_fallback_mode_enabled
 
 
 # --------------------------------------------------------------------
@@ -57,25 +60,26 @@ ALL_INTENTS: List[Dict[str, str]] = SUPPORTED_INTENTS + SYSTEM_INTENTS
 
 # Agentic flows: planning_node handles entire dialogue loop and approvals
 # No downstream confirm nodes when planning succeeds
-AGENTIC_FLOW_REGISTRY = {
+# Registries are read-only (MappingProxyType of tuples) so consumers can share them without copying
+AGENTIC_FLOW_REGISTRY: Mapping[str, Tuple[str, ...]] = MappingProxyType({
     # --- Plan lifecycle (agentic path) ---
-    "create_new_plan": ["planning_node"],  # Single agentic node handles full flow
-    "revise_plan": ["planning_node"],      # Re-planning via agentic approach
-    "adaptive_replan": ["planning_node"],  # Adaptive re-planning
+    "create_new_plan": ("planning_node",),  # Single agentic node handles full flow
+    "revise_plan": ("planning_node",),      # Re-planning via agentic approach
+    "adaptive_replan": ("planning_node",),  # Adaptive re-planning
     
     # --- Direct operations (no planning needed) ---
-    "update_task": ["update_task_node", "persistence_node"],
-    "reschedule_task": ["reschedule_task_node", "persistence_node"], 
-    "remove_task": ["remove_task_node", "persistence_node"],
-    "show_summary": ["summary_node"],
-    "sync_all_plans_across_all_goals": ["sync_plans_node"],
-}
+    "update_task": ("update_task_node", "persistence_node"),
+    "reschedule_task": ("reschedule_task_node", "persistence_node"), 
+    "remove_task": ("remove_task_node", "persistence_node"),
+    "show_summary": ("summary_node",),
+    "sync_all_plans_across_all_goals": ("sync_plans_node",),
+})
 
 # Deterministic fallback flows: modular nodes for legacy/fallback mode
 # Used when PLANNING_FALLBACK_MODE=True or agentic planning fails
-FALLBACK_FLOW_REGISTRY = {
+FALLBACK_FLOW_REGISTRY: Mapping[str, Tuple[str, ...]] = MappingProxyType({
     # --- Plan lifecycle (deterministic fallback) ---
-    "create_new_plan": [
+    "create_new_plan": (
         "plan_outline_node_legacy",   # deterministic, not planning_node
         "user_confirm_a_node",
         "task_generation_node",
@@ -84,14 +88,14 @@ FALLBACK_FLOW_REGISTRY = {
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "edit_existing_plan": [
+    ),
+    "edit_existing_plan": (
         "update_task_node",       # direct edit to existing task/plan
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "revise_plan": [
+    ),
+    "revise_plan": (
         "plan_outline_node_legacy",   # deterministic re-outline
         "user_confirm_a_node",
         "task_generation_node",        # rebuild tasks
@@ -100,8 +104,8 @@ FALLBACK_FLOW_REGISTRY = {
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "adaptive_replan": [
+    ),
+    "adaptive_replan": (
         "plan_outline_node_legacy",   # deterministic re-outline under constraints
         "task_generation_node",
         "world_model_integration_node",
@@ -109,8 +113,8 @@ FALLBACK_FLOW_REGISTRY = {
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "reset_existing_plan": [
+    ),
+    "reset_existing_plan": (
         "plan_reset_node",        # wipe/rebuild baseline
         "plan_outline_node_legacy",
         "user_confirm_a_node",
@@ -119,30 +123,30 @@ FALLBACK_FLOW_REGISTRY = {
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
+    ),
 
     # --- Task-level operations ---
-    "update_task": [
+    "update_task": (
         "update_task_node",
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "reschedule_task": [
+    ),
+    "reschedule_task": (
         "reschedule_task_node",
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "remove_task": [
+    ),
+    "remove_task": (
         "remove_task_node",
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
+    ),
 
     # --- Goal-level operations ---
-    "update_goal": [
+    "update_goal": (
         "goal_update_node",
         "plan_outline_node_legacy",
         "user_confirm_a_node",
@@ -151,46 +155,46 @@ FALLBACK_FLOW_REGISTRY = {
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "pause_goal": [
+    ),
+    "pause_goal": (
         "pause_goal_node",
         "persistence_node",
-    ],
+    ),
 
     # --- Meta/system operations ---
-    "give_feedback": [
+    "give_feedback": (
         "feedback_logger_node",
         "acknowledge_node",
-    ],
-    "undo_last_action": [
+    ),
+    "undo_last_action": (
         "undo_node",
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "add_constraint": [
+    ),
+    "add_constraint": (
         "constraint_node",
         "plan_outline_node_legacy",   # constraint may require re-outline
         "task_generation_node",
         "validation_node",
         "user_confirm_b_node",
         "persistence_node",
-    ],
-    "sync_all_plans_across_all_goals": [
+    ),
+    "sync_all_plans_across_all_goals": (
         "sync_plans_node",
         "validation_node", 
         "user_confirm_b_node",
         "persistence_node",
-    ],
+    ),
 
     # --- Information requests ---
-    "show_summary": ["summary_node"],
-    "see_goal_performance": ["performance_node"],
-    "see_overall_performance": ["performance_node"],
-    "ask_question": ["conversation_node"],
-    "ask_about_preferences": ["preference_node"],
-    "clarify": ["clarification_node"],
-}
+    "show_summary": ("summary_node",),
+    "see_goal_performance": ("performance_node",),
+    "see_overall_performance": ("performance_node",),
+    "ask_question": ("conversation_node",),
+    "ask_about_preferences": ("preference_node",),
+    "clarify": ("clarification_node",),
+})
 
 # Phase 6: Feature-flag aware flow selection
 def get_flow_registry():
@@ -200,13 +204,12 @@ def get_flow_registry():
     Returns:
         AGENTIC_FLOW_REGISTRY if PLANNING_FALLBACK_MODE=False (default)
         FALLBACK_FLOW_REGISTRY if PLANNING_FALLBACK_MODE=True
+
+    Both registries are shared, read-only MappingProxyType views of node-name
+    tuples, so callers get them without copying; the only per-call work is the
+    live flag read (which must stay uncached so flips take effect).
     """
-    from app.config.feature_flags import is_fallback_mode_enabled
-    
-    if is_fallback_mode_enabled():
-        return FALLBACK_FLOW_REGISTRY
-    else:
-        return AGENTIC_FLOW_REGISTRY
+    return FALLBACK_FLOW_REGISTRY if is_fallback_mode_enabled() else AGENTIC_FLOW_REGISTRY
 
 # Maintain backward compatibility
 DEFAULT_FLOW_REGISTRY = FALLBACK_FLOW_REGISTRY  # Legacy name points to fallback
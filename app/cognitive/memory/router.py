@@ -16,6 +16,7 @@ TODO for next version:
 """
 
 import logging
+import re
 from typing import List, Dict, Optional, Any
 from enum import Enum
 from dataclasses import dataclass
@@ -96,6 +97,12 @@ class MemoryRouter:
                 "characteristic", "behavior", "preference", "style"
             ]
         }
+        
+        # Keyword lists compiled to one alternation each (plain substring semantics)
+        self._keyword_res = {
+            name: re.compile("|".join(map(re.escape, keywords)))
+            for name, keywords in self._content_patterns.items()
+        }
     
     def route_storage(
         self,
@@ -234,24 +241,12 @@ class MemoryRouter:
         """Analyze content to determine likely memory types"""
         suggested_types = []
         
-        # Check for episodic indicators
-        episodic_matches = sum(1 for keyword in self._content_patterns["episodic_keywords"] 
-                             if keyword in content)
-        
-        # Check for procedural indicators
-        procedural_matches = sum(1 for keyword in self._content_patterns["procedural_keywords"] 
-                               if keyword in content)
-        
-        # Check for semantic indicators
-        semantic_matches = sum(1 for keyword in self._content_patterns["semantic_keywords"] 
-                             if keyword in content)
-        
-        # Determine types based on matches (threshold = 1)
-        if episodic_matches >= 1:
+        # One scan per memory type; a single keyword hit is enough (threshold = 1)
+        if self._keyword_res["episodic_keywords"].search(content):
             suggested_types.append("episodic")
-        if procedural_matches >= 1:
+        if self._keyword_res["procedural_keywords"].search(content):
             suggested_types.append("procedural")
-        if semantic_matches >= 1:
+        if self._keyword_res["semantic_keywords"].search(content):
             suggested_types.append("semantic")
         
         return suggested_types
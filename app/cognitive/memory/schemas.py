@@ -3,12 +3,12 @@
 from sqlalchemy import Column, String, DateTime, JSON, Enum, Integer, Float, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 import enum
 import uuid
 
 # Import the main Base from models.py to ensure consistency
 from app.models import Base
+from app.utils.clock import utcnow
 
 # Memory types
 class MemoryType(str, enum.Enum):
@@ -26,7 +26,7 @@ class MemoryORM(Base):
     type = Column(Enum(MemoryType), nullable=False)
     content = Column(JSON, nullable=False)
     memory_metadata = Column(JSON, nullable=True)  # Renamed to avoid conflict with SQLAlchemy metadata
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, default=utcnow)
     
     # Relationships
     source_associations = relationship("MemoryAssociation", foreign_keys="MemoryAssociation.source_memory_id", back_populates="source_memory")
@@ -41,7 +41,7 @@ class MemoryAssociation(Base):
     target_memory_id = Column(UUID(as_uuid=True), ForeignKey("memory_objects.memory_id"), nullable=False)
     association_type = Column(String(50), nullable=False)
     strength = Column(Float, nullable=False, default=1.0)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
     
     # Relationships
     source_memory = relationship("MemoryORM", foreign_keys=[source_memory_id], back_populates="source_associations")
@@ -3,11 +3,11 @@
 SQLAlchemy ORM models for World State persistence
 """
 
-from datetime import datetime
-
 from sqlalchemy import Column, String, DateTime, Integer, Text, Float
 from sqlalchemy.ext.declarative import declarative_base
 
+from app.utils.clock import utcnow
+
 from .world_state import CalendarizedTask
 
 Base = declarative_base()
@@ -42,8 +42,8 @@ class CalendarizedTaskORM(Base):
     notes = Column(Text, nullable=True)
     
     # Audit fields
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
     
     def to_pydantic(self) -> CalendarizedTask:
         """Convert ORM model to Pydantic model"""
@@ -113,7 +113,7 @@ class CapacityLoadORM(Base):
     load_hours = Column(Float, nullable=False, default=0.0)
     
     # Audit
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
 
 
 class WorldStateSnapshot(Base):
@@ -125,5 +125,5 @@ class WorldStateSnapshot(Base):
     id = Column(String, primary_key=True)
     user_id = Column(String, nullable=False, index=True)
     snapshot_data = Column(Text, nullable=False)  # JSON of complete world state
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
     reason = Column(String, nullable=True)  # "pre_plan_application", "rollback_point", etc.
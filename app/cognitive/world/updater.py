@@ -608,10 +608,11 @@ class WorldUpdater:
             return
         
         try:
-            scheduled_task = self.db_session.query(ScheduledTask).filter_by(id=task_id).first()
-            if scheduled_task:
-                self.db_session.delete(scheduled_task)
-                self.db_session.flush()
+            # Single DELETE instead of SELECT-then-delete; a missing row is a no-op
+            self.db_session.query(ScheduledTask).filter_by(id=task_id).delete(
+                synchronize_session="fetch"
+            )
+            self.db_session.flush()
         except Exception as e:
             self.db_session.rollback()
             raise e
@@ -5,23 +5,25 @@ Toggles between agentic and deterministic fallback flows.
 """
 
 import os
-from typing import Dict, Any
+from typing import Any, FrozenSet
 
-# Phase 6 Feature Flag: Toggle between agentic and deterministic fallback planning
-PLANNING_FALLBACK_MODE: bool = os.getenv("PLANNING_FALLBACK_MODE", "false").lower() == "true"
+def _env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment (only "true", case-insensitive, enables it)."""
+    return os.getenv(name, "false").lower() == "true"
 
-# Phase 7 Feature Flag: Use LangGraph ReAct agent inside controller stages (off by default)
-PLANNING_USE_REACT_AGENT: bool = os.getenv("PLANNING_USE_REACT_AGENT", "false").lower() == "true"
-
-# Phase 7 Tooling Flag: Use LLM-backed implementations for planning tools (off by default)
-PLANNING_USE_LLM_TOOLS: bool = os.getenv("PLANNING_USE_LLM_TOOLS", "false").lower() == "true"
-
-# Feature flag registry for easy management
-FEATURE_FLAGS: Dict[str, Any] = {
-    "PLANNING_FALLBACK_MODE": PLANNING_FALLBACK_MODE,
-    "PLANNING_USE_REACT_AGENT": PLANNING_USE_REACT_AGENT,
-    "PLANNING_USE_LLM_TOOLS": PLANNING_USE_LLM_TOOLS,
-}
+# Registered flag names. Values are never cached: is_fallback_mode_enabled() and
+# get_flag() read the environment on every call, so tests can toggle flags with
+# monkeypatch.setenv instead of reloading this module.
+FEATURE_FLAGS: FrozenSet[str] = frozenset({
+    # Phase 6: toggle between agentic and deterministic fallback planning
+    "PLANNING_FALLBACK_MODE",
+    # Phase 7: use LangGraph ReAct agent inside controller stages (off by default)
+    "PLANNING_USE_REACT_AGENT",
+    # Phase 7 tooling: use LLM-backed implementations for planning tools (off by default)
+    "PLANNING_USE_LLM_TOOLS",
+    # Telegram: serve repeated read-only prompts from an in-memory response cache (off by default)
+    "TELEGRAM_RESPONSE_CACHE",
+})
 
 def is_fallback_mode_enabled() -> bool:
     """
@@ -30,8 +32,10 @@ def is_fallback_mode_enabled() -> bool:
     When False (default): Use agentic planning_node (ReAct-style) 
     When True: Use deterministic modular flow (legacy)
     """
-    return FEATURE_FLAGS["PLANNING_FALLBACK_MODE"]
+    return _env_flag("PLANNING_FALLBACK_MODE")
 
 def get_flag(flag_name: str, default: Any = None) -> Any:
-    """Get feature flag value by name."""
-    return FEATURE_FLAGS.get(flag_name, default)
\ No newline at end of file
+    """Get the current value of a registered feature flag by name."""
+    if flag_name not in FEATURE_FLAGS:
+        return default
+    return _env_flag(flag_name)
\ No newline at end of file
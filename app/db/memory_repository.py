@@ -23,17 +23,18 @@ class MemoryRepository:
 
 
     def save_memory_updates(self, user_id: int, updates: dict):
-        """Persist updates back to DB."""
-        # episodic updates
-        for e in updates.get("episodic", []):
-            self.db.add(EpisodicMemory(user_id=user_id, content=e))
-
-        # semantic updates
-        for s in updates.get("semantic", []):
-            self.db.add(SemanticMemory(user_id=user_id, content=s))
-
-        # procedural updates
-        for p in updates.get("procedural", []):
-            self.db.add(ProceduralMemory(user_id=user_id, content=p))
-
-        self.db.commit()
+        """Persist updates back to DB in a single transaction."""
+        rows = [
+            *(EpisodicMemory(user_id=user_id, content=e) for e in updates.get("episodic", [])),
+            *(SemanticMemory(user_id=user_id, content=s) for s in updates.get("semantic", [])),
+            *(ProceduralMemory(user_id=user_id, content=p) for p in updates.get("procedural", [])),
+        ]
+        if not rows:
+            return
+
+        try:
+            self.db.add_all(rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
@@ -2,7 +2,7 @@
 # =============================
 
 from __future__ import annotations
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Mapping, Sequence, Tuple
 import json
 import logging
 
@@ -29,7 +29,7 @@ def build_planner_messages(intent: str, memory_context: MemoryContext, registry:
         "Reference defaults (for safety only, not mandatory), "
         "which are deterministic default flows used as a last resort. "
         "You don't have to follow them, but you may take inspiration and are still encouraged to improve or adapt them if context suggests:\n"
-        f"{json.dumps(get_flow_registry(), indent=2)}\n"
+        f"{json.dumps(dict(get_flow_registry()), indent=2)}\n"
     )
 
     # Compact registry spec for the LLM
@@ -83,7 +83,7 @@ def propose_sequence_llm(intent: str, memory_context: MemoryContext, registry: D
     return {"sequence": seq, "reason": data.get("reason"), "raw": resp.content}
 
 
-def plan_flow_sequence(intent: str, memory_context: MemoryContext, registry: Dict[str, NodeSpec], defaults: Dict[str, List[str]], temperature: float = 0.0, parameters: Dict[str, Any] | None = None) -> Tuple[List[str], bool, Dict[str, Any]]:
+def plan_flow_sequence(intent: str, memory_context: MemoryContext, registry: Dict[str, NodeSpec], defaults: Mapping[str, Sequence[str]], temperature: float = 0.0, parameters: Dict[str, Any] | None = None) -> Tuple[List[str], bool, Dict[str, Any]]:
     """Try LLM-based proposal first; fall back to deterministic defaults on failure.
     Returns: (sequence, used_llm, meta)
     """
@@ -92,7 +92,7 @@ def plan_flow_sequence(intent: str, memory_context: MemoryContext, registry: Dic
         return result["sequence"], True, result
     except Exception as e:
         logger.warning("LLM planner failed; falling back. error=%s", e)
-        seq = defaults.get(intent) or []
+        seq = list(defaults.get(intent, ()))
         return seq, False, {"error": str(e)}
 
 
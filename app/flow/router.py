@@ -3,7 +3,7 @@ Router functions for post-node conditional branching in LangGraph flows.
 """
 
 from __future__ import annotations
-from typing import Literal
+from typing import Dict, Literal
 import logging
 from app.cognitive.state.graph_state import GraphState
 
@@ -25,6 +25,15 @@ RouteKey = Literal[
 # }
 
 
+# planning_status -> route. One dict probe instead of a chain of string
+# comparisons; str hashes are cached, so the lookup is effectively O(1).
+_ROUTE_BY_STATUS: Dict[str, RouteKey] = {
+    "complete": "to_world_model",
+    "needs_scheduling_escalation": "to_scheduling_escalation",
+    "needs_clarification": "to_planning_loop",
+}
+
+
 def route_after_planning_result(state: GraphState) -> RouteKey:
     """
     Single point of truth for post-planning branching (Phase 5).
@@ -37,17 +46,11 @@ def route_after_planning_result(state: GraphState) -> RouteKey:
       - aborted / anything else    -> to_summary_or_end
     """
     status = (state.planning_status or "").strip()
-    route: RouteKey
+    # Default safeguard: summarize and end
+    route: RouteKey = _ROUTE_BY_STATUS.get(status, "to_summary_or_end")
 
-    if status == "complete":
-        route = "to_world_model"
-    elif status == "needs_scheduling_escalation":
-        route = "to_scheduling_escalation"
-    elif status == "needs_clarification":
-        route = "to_planning_loop"
-    else:
-        # Default safeguard: summarize and end
-        route = "to_summary_or_end"
+    if not log.isEnabledFor(logging.INFO):
+        return route
 
     log.info(
         "router.post_planning",
@@ -6,10 +6,9 @@ from app.routers import goals, cycles, occurrences, planning, telegram, users
 from contextlib import asynccontextmanager
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-)
+from app.utils.logging import configure_logging
+
+configure_logging()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -21,7 +20,9 @@ async def lifespan(app: FastAPI):
     if mode == "webhook":
         webhook_url = os.environ.get("TELEGRAM_WEBHOOK_URL")
         if webhook_url:
-            await telegram.application.bot.set_webhook(webhook_url)
+            await telegram.application.bot.set_webhook(
+                webhook_url, allowed_updates=telegram.ALLOWED_UPDATES
+            )
             logging.info(f"🔗 Webhook set to {webhook_url}")
     else:
         logging.info("💡 Skipping webhook — running in polling mode (manual start required).")
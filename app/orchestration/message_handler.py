@@ -1,6 +1,8 @@
 # app/orchestration/message_handler.py
 
 import logging
+from typing import Optional
+
 from app.cognitive.brain.intent_recognition_node import detect_intent
 from app.flow.flow_planner_llm import plan_flow_sequence
 from app.flow.flow_compiler import FlowCompiler, CompileOptions
@@ -8,11 +10,28 @@ from app.flow.adapters.langgraph_adapter import LangGraphBuilderAdapter
 from app.flow.node_registry import NODE_REGISTRY
 from app.cognitive.state.graph_state import GraphState
 from app.cognitive.brain.intent_registry_routes import get_flow_registry
+from app.utils.response_cache import ResponseCache
 # from app.flow.conditions import route_after_confirm_a  # router (legacy, not used in agentic path)
 
 logger = logging.getLogger(__name__)
 
-def handle_user_message(user_id: int, user_message: str, memory_context) -> str:
+# Intents whose flows only read plans/memory. Only these turns may be served
+# from the response cache; any other intent can advance a dialogue (approvals,
+# clarifications) or change state, so it always runs and invalidates the cache.
+READ_ONLY_INTENTS = frozenset({
+    "show_summary",
+    "see_goal_performance",
+    "see_overall_performance",
+    "ask_about_preferences",
+})
+
+
+def handle_user_message(
+    user_id: int,
+    user_message: str,
+    memory_context,
+    response_cache: Optional[ResponseCache] = None,
+) -> str:
     """
     Orchestrates one user message end-to-end:
     1. Detect intent
@@ -20,11 +39,29 @@ def handle_user_message(user_id: int, user_message: str, memory_context) -> str:
     3. Compile graph with routers
     4. Run graph
     5. Return response_text (for Telegram)
+
+    With a response_cache, replies to read-only intents are stored and every
+    other intent invalidates the user's cached entries. Callers look the prompt
+    up in the cache before loading memory, so a hit skips intent detection too.
     """
 
     # Step A: intent recognition
     intent_result = detect_intent(user_message, memory_context)
     intent = intent_result.intent
+
+    cacheable = response_cache is not None and intent in READ_ONLY_INTENTS
+    if response_cache is not None and not cacheable:
+        response_cache.invalidate_user(user_id)
+
+    response_text = _run_flow(user_message, memory_context, intent_result)
+    if cacheable:
+        response_cache.put(user_id, user_message, response_text)
+    return response_text
+
+
+def _run_flow(user_message: str, memory_context, intent_result) -> str:
+    """Plan, compile and run the flow for a recognized intent; return the reply text."""
+    intent = intent_result.intent
     params = intent_result.parameters
 
     # Step B: plan flow sequence
@@ -0,0 +1,19 @@
+# app/routers/cache_invalidation.py
+from fastapi import Request
+
+from app.utils.response_cache import invalidate_cached_responses
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def invalidate_responses_on_write(request: Request):
+    """Router dependency: drop cached chat responses after any plan/goal write.
+
+    Runs after the endpoint (also when it raises, since a write may already be
+    committed) so a cached summary can never outlive the data it describes.
+    """
+    try:
+        yield
+    finally:
+        if request.method not in _READ_METHODS:
+            invalidate_cached_responses()
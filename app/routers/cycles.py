@@ -3,11 +3,13 @@ from sqlalchemy.orm import Session
 from app import schemas
 from app.crud import crud
 from app.db.db import get_db
+from app.routers.cache_invalidation import invalidate_responses_on_write
 from typing import List
 
 router = APIRouter(
     prefix="/cycles",
-    tags=["Habit Cycles"]
+    tags=["Habit Cycles"],
+    dependencies=[Depends(invalidate_responses_on_write)],
 )
 
 @router.post("/{cycle_id}/occurrences", response_model=schemas.GoalOccurrenceRead)
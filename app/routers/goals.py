@@ -8,11 +8,13 @@ from app.crud import crud
 from app.db.db import get_db
 from app.routers.users import get_current_user
 from app.models import User
+from app.routers.cache_invalidation import invalidate_responses_on_write
 
 # Step 1: Create the API router for goals
 router = APIRouter(
     prefix="/goals",
-    tags=["goals"]
+    tags=["goals"],
+    dependencies=[Depends(invalidate_responses_on_write)],
 )
 
 # === CREATE GOAL (Plan-Centric Architecture) ===
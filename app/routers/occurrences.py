@@ -3,10 +3,12 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from app.crud import crud
 from app.db.db import get_db
+from app.routers.cache_invalidation import invalidate_responses_on_write
 
 router = APIRouter(
     prefix="/occurrences",
-    tags=["Goal Occurrences"]
+    tags=["Goal Occurrences"],
+    dependencies=[Depends(invalidate_responses_on_write)],
 )
 
 @router.get("/{occurrence_id}", response_model=schemas.GoalOccurrenceRead)
@@ -15,11 +15,13 @@ from app.crud import crud, planner
 from app.models import PlanFeedbackAction, Feedback, Plan
 from app.routers.users import get_current_user
 from app.models import User
+from app.routers.cache_invalidation import invalidate_responses_on_write
 from datetime import date
 
 router = APIRouter(
     prefix="/planning",
-    tags=["AI Planning"]
+    tags=["AI Planning"],
+    dependencies=[Depends(invalidate_responses_on_write)],
 )
 
 # ------------------------------------------------
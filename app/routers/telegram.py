@@ -1,13 +1,19 @@
 # app/routers/telegram.py
+import asyncio
 import logging
 import os
+import weakref
 import telegram
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.constants import ChatAction, ParseMode
+from telegram.helpers import escape_markdown
+from telegram.ext import CommandHandler, MessageHandler, filters, ContextTypes
 
 from app.orchestration.message_handler import handle_user_message
 from app.db.db import get_db
 from app.db.memory_repository import MemoryRepository
+from app.utils.response_cache import get_response_cache
+from app.utils.telegram_bot import build_application
 from fastapi import APIRouter, Request
 
 logger = logging.getLogger(__name__)
@@ -15,42 +21,96 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/telegram", tags=["telegram"])
 
 BOT_TOKEN = os.environ["TELEGRAM_BOT_TOKEN"]
-application = Application.builder().token(BOT_TOKEN).build()
+application = build_application(BOT_TOKEN)
+
+# Only text messages are handled; ask Telegram not to deliver anything else
+# (edits, channel posts, chat member updates, ...) so PTB never decodes them.
+ALLOWED_UPDATES = [Update.MESSAGE]
 
 # --- Webhook endpoint (only used if TELEGRAM_MODE=webhook) ---
 @router.post("/webhook")
 async def telegram_webhook(request: Request):
     data = await request.json()
-    logger.info(f"📥 Incoming update: {data}")
+    logger.debug("📥 Incoming update: %s", data)
     update = telegram.Update.de_json(data, application.bot)
-    await application.process_update(update)
+    # Hand off to the queue consumed by application.start() and ack right away
+    application.update_queue.put_nowait(update)
     return {"ok": True}
 
 # --- Handlers ---
+# Escaped once at import; every /start reuses the same string.
+WELCOME_MESSAGE = escape_markdown("👋 Hello! I’m your Smart Planner Bro!", version=2)
+
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.message:
-        await update.message.reply_text("👋 Hello! I’m your Smart Planner Bro!")
+        await update.message.reply_text(
+            WELCOME_MESSAGE, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True
+        )
+
+# Per-chat locks keep turns ordered within a chat while different chats run
+# concurrently. Weak values: a lock disappears once no pending turn holds it.
+_chat_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _chat_lock(chat_id: int) -> asyncio.Lock:
+    lock = _chat_locks.get(chat_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _chat_locks[chat_id] = lock
+    return lock
 
-async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if update.effective_user is None or update.message is None or update.message.text is None:
-        return
-    user_id = update.effective_user.id
-    user_message = update.message.text
 
-    with next(get_db()) as db:
+def _run_turn(user_id: int, user_message: str) -> str:
+    """Load memory, run the orchestrator and persist memory updates (blocking)."""
+    # Repeated read-only prompts (summaries, performance) are answered before
+    # touching the DB or the intent LLM; see READ_ONLY_INTENTS.
+    response_cache = get_response_cache()
+    if response_cache is not None:
+        cached = response_cache.get(user_id, user_message)
+        if cached is not None:
+            return cached
+
+    db = next(get_db())
+    try:
         repo = MemoryRepository(db)
         memory_context = repo.get_memory_context(user_id)
+        response_text = handle_user_message(user_id, user_message, memory_context, response_cache)
+        if memory_context.memory_updates:
+            repo.save_memory_updates(user_id, memory_context.memory_updates)
+        return response_text
+    finally:
+        db.close()
+
+
+async def _process_message(update: Update, user_id: int, user_message: str, lock: asyncio.Lock):
+    async with lock:
+        # The typing indicator does not depend on the turn, so send it while
+        # the turn runs instead of paying its round-trip up front.
+        typing_task = asyncio.create_task(update.message.chat.send_action(ChatAction.TYPING))
+        try:
+            response_text = await asyncio.to_thread(_run_turn, user_id, user_message)
+        except Exception as e:
+            logger.exception("Error handling user message: %s", e)
+            response_text = "❌ Sorry, something went wrong."
+
+        await asyncio.gather(
+            typing_task, update.message.reply_text(response_text, parse_mode="Markdown")
+        )
 
-    try:
-        response_text = await handle_user_message(user_id, user_message, memory_context)
-    except Exception as e:
-        logger.exception(f"Error handling user message: {e}")
-        response_text = "❌ Sorry, something went wrong."
 
-    if hasattr(memory_context, "memory_updates") and memory_context.memory_updates:
-        repo.save_memory_updates(user_id, memory_context.memory_updates)
+async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if update.effective_user is None or update.message is None or update.message.text is None:
+        return
+    user_id = update.effective_user.id
+    user_message = update.message.text
 
-    await update.message.reply_text(response_text, parse_mode="Markdown")
+    # Run the (slow, LLM-bound) turn in the background so a long call in one
+    # chat does not hold up update dispatch for every other chat.
+    lock = _chat_lock(update.message.chat_id)
+    context.application.create_task(
+        _process_message(update, user_id, user_message, lock), update=update
+    )
 
 # register handlers
 application.add_handler(CommandHandler("start", start))
@@ -59,4 +119,4 @@ application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_m
 # --- Optional polling runner for local dev ---
 def run_polling():
     logger.info("🤖 Starting Telegram bot in POLLING mode...")
-    application.run_polling()
+    application.run_polling(allowed_updates=ALLOWED_UPDATES)
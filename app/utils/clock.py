@@ -0,0 +1,13 @@
+"""
+Shared clock helpers.
+"""
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Naive UTC now, the non-deprecated equivalent of ``datetime.utcnow()``.
+
+    ORM columns are naive ``DateTime`` (timestamp without time zone); an aware
+    value would be shifted into the DB session TimeZone on insert.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -12,12 +12,17 @@ from typing import Any, Dict, Optional
 from contextlib import contextmanager
 from functools import wraps
 
-# Configure basic structured logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure root logging for an entrypoint (app.main, CLI scripts).
+
+    Importing this module has no side effects on logging; libraries, tests and
+    embedding apps keep whatever configuration they set up themselves.
+    """
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
 
 def get_planning_logger(name: str = __name__):
     """Get a logger instance for planning operations."""
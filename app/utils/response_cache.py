@@ -0,0 +1,135 @@
+"""
+In-memory LRU cache for chat responses.
+
+Keys are (user_id, generation, normalized prompt) hashed with sha256, so "Show
+me my plans" and "show me my plans?" share an entry. Entries expire after a TTL
+and the least recently used entry is evicted once the cache is full. Responses
+that mention a date are not cached since they go stale as soon as the day changes.
+
+Only read-only turns are stored, so a hit can be served before intent
+detection or loading memory. Any turn that may change the user's plans or
+memory calls ``invalidate_user``; bumping the user's generation makes every
+earlier entry for that user unreachable. Writes outside the chat flow (REST
+routers) call ``invalidate_cached_responses()`` to drop everything.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import string
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from app.config.feature_flags import get_flag
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SEC = 3600.0
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+# ISO dates (2025-01-31) and day/month style dates (31/01/2025, 1.2.25)
+_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}[/.]\d{1,2}[/.]\d{2,4}\b")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    text = prompt.lower().translate(_PUNCTUATION_TABLE)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def make_key(user_id: int, prompt: str, generation: int = 0) -> str:
+    return hashlib.sha256(f"{user_id}:{generation}:{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+
+def is_cacheable(response: str) -> bool:
+    """Responses with dynamic content (dates) must always be regenerated."""
+    return bool(response) and _DATE_RE.search(response) is None
+
+
+class ResponseCache:
+    """Thread-safe LRU + TTL cache mapping (user_id, prompt) to a response string."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, user_id: int, prompt: str) -> str:
+        return make_key(user_id, prompt, self._generations.get(user_id, 0))
+
+    def get(self, user_id: int, prompt: str) -> Optional[str]:
+        with self._lock:
+            key = self._key(user_id, prompt)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, user_id: int, prompt: str, response: str) -> None:
+        if not is_cacheable(response):
+            return
+        with self._lock:
+            key = self._key(user_id, prompt)
+            self._entries[key] = (self._clock() + self.ttl_sec, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached response for a user; stale entries age out via LRU/TTL."""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide cache, or None while TELEGRAM_RESPONSE_CACHE is off."""
+    global _shared_cache
+    if not get_flag("TELEGRAM_RESPONSE_CACHE", False):
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
+
+
+def invalidate_cached_responses(user_id: Optional[int] = None) -> None:
+    """Invalidate one user's cached responses, or all of them when user_id is None.
+
+    REST writes pass no user_id: their user ids are app ids, while the cache is
+    keyed by Telegram user id, and writes there are rare enough to drop everything.
+    """
+    cache = _shared_cache
+    if cache is None:
+        return
+    if user_id is None:
+        cache.clear()
+    else:
+        cache.invalidate_user(user_id)
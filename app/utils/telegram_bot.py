@@ -0,0 +1,75 @@
+"""
+Shared python-telegram-bot setup for the FastAPI router and the local polling script.
+
+Keeps the getUpdates timeouts and the error handler in one place so every bot
+entrypoint behaves the same on flaky networks.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from telegram.error import TimedOut
+from telegram.ext import Application, ContextTypes
+from telegram.request import HTTPXRequest
+
+logger = logging.getLogger(__name__)
+
+# Bot API request pool. One tuned HTTPX pool per Application keeps TLS
+# connections warm across send_message/send_chat_action calls.
+CONNECTION_POOL_SIZE = 32
+READ_TIMEOUT = 40
+CONNECT_TIMEOUT = 10
+POOL_TIMEOUT = 15
+
+# getUpdates timeouts (seconds). PTB adds the long-poll window on top of the
+# read timeout, so these only bound connection setup and pool waits.
+GET_UPDATES_READ_TIMEOUT = 25
+GET_UPDATES_CONNECT_TIMEOUT = 25
+GET_UPDATES_POOL_TIMEOUT = 15
+
+
+async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Log handler/polling errors.
+
+    Timeouts with no update attached come from getUpdates/network polling and are
+    routine on long polls, so they go to DEBUG. Anything tied to an update (e.g. a
+    reply that timed out) means a user may have missed a response and stays ERROR.
+    """
+    if update is None and isinstance(context.error, (TimedOut, asyncio.TimeoutError)):
+        logger.debug("Telegram request timed out: %s", context.error)
+        return
+    logger.error("Unhandled error while processing update %s", update, exc_info=context.error)
+
+
+def build_request() -> HTTPXRequest:
+    """Pooled HTTPX request used for regular Bot API calls."""
+    return HTTPXRequest(
+        connection_pool_size=CONNECTION_POOL_SIZE,
+        read_timeout=READ_TIMEOUT,
+        connect_timeout=CONNECT_TIMEOUT,
+        pool_timeout=POOL_TIMEOUT,
+    )
+
+
+def build_get_updates_request() -> HTTPXRequest:
+    """Dedicated request for getUpdates so long polls never hold a pool slot needed for replies."""
+    return HTTPXRequest(
+        connection_pool_size=1,
+        read_timeout=GET_UPDATES_READ_TIMEOUT,
+        connect_timeout=GET_UPDATES_CONNECT_TIMEOUT,
+        pool_timeout=GET_UPDATES_POOL_TIMEOUT,
+    )
+
+
+def build_application(token: str) -> Application:
+    """Build a PTB Application with pooled requests, tuned timeouts and the shared error handler."""
+    application = (
+        Application.builder()
+        .token(token)
+        .request(build_request())
+        .get_updates_request(build_get_updates_request())
+        .build()
+    )
+    application.add_error_handler(error_handler)
+    return application
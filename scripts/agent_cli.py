@@ -27,9 +27,12 @@ def main():
     if args.debug:
         os.environ["PLANNING_DEBUG"] = "1"
 
+    from app.utils.logging import configure_logging
     from app.cognitive.agents.planning_controller import PlanningController
     from app.cognitive.state.graph_state import GraphState
 
+    configure_logging()
+
     ctrl = PlanningController()
 
     session_id = f"cli_session_{int(time.time())}"
@@ -35,7 +35,8 @@ curl -s -X POST https://api.telegram.org/bot$TELEGRAM_BOT_TOKEN/deleteWebhook |
 
 echo "🔗 Setting Telegram webhook to $WEBHOOK_URL"
 curl -s -X POST https://api.telegram.org/bot$TELEGRAM_BOT_TOKEN/setWebhook \
-    -d "url=$WEBHOOK_URL" | jq
+    -d "url=$WEBHOOK_URL" \
+    --data-urlencode 'allowed_updates=["message"]' | jq
 
 # --- 5. Export to runtime env ---
 export TELEGRAM_WEBHOOK_URL="$WEBHOOK_URL"
@@ -32,9 +32,12 @@ def run(goal: str, debug: bool = False):
         # Continue anyway to allow controller to respond with guidance
 
     # Import here after sys.path adjustments
+    from app.utils.logging import configure_logging
     from app.cognitive.agents.planning_controller import PlanningController
     from app.cognitive.state.graph_state import GraphState
 
+    configure_logging()
+
     state = GraphState(
         user_input=goal,
         run_metadata={
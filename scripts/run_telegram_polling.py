@@ -8,7 +8,10 @@ import os
 import sys
 import logging
 from dotenv import load_dotenv
-from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram import Update
+from telegram.constants import ParseMode
+from telegram.helpers import escape_markdown
+from telegram.ext import CommandHandler, MessageHandler, filters
 
 # Add project root to path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -25,59 +28,44 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # --- Environment check ---
+REQUIRED_VARS = frozenset({"TELEGRAM_BOT_TOKEN", "OPENAI_API_KEY", "DATABASE_URL"})
+
 def check_environment() -> bool:
-    required_vars = ["TELEGRAM_BOT_TOKEN", "OPENAI_API_KEY", "DATABASE_URL"]
-    missing = [v for v in required_vars if not os.getenv(v)]
+    missing = REQUIRED_VARS - {k for k, v in os.environ.items() if v}
     if missing:
-        logger.error(f"❌ Missing env vars: {', '.join(missing)}")
+        logger.error("❌ Missing env vars: %s", ", ".join(sorted(missing)))
         logger.error("Please ensure your .env file contains all required variables.")
         return False
     logger.info("✅ All required environment variables are set")
     return True
 
 # --- Handlers ---
-async def start(update, context):
-    await update.message.reply_text("👋 Hello! I’m your Smart Planner Bot.")
-
-async def handle_message(update, context):
-    from app.orchestration.message_handler import handle_user_message
-    from app.db.db import get_db
-    from app.db.memory_repository import MemoryRepository
-    from app.cognitive.contracts.types import MemoryContext
-
-    user_id = update.effective_user.id
-    user_message = update.message.text
-    logger.info(f"[Telegram] user_id={user_id}, message={user_message!r}")
+WELCOME_MESSAGE = escape_markdown("👋 Hello! I’m your Smart Planner Bot.", version=2)
 
-
-    try:
-        db = next(get_db())
-        try:
-            repo = MemoryRepository(db)
-            memory_context = repo.get_memory_context(user_id)
-            response_text = await handle_user_message(user_id, user_message, memory_context)
-            repo.save_memory_updates(user_id, memory_context.memory_updates)
-        finally:
-            db.close()
-    except Exception:
-        logger.exception("Error in handle_message")
-        response_text = "❌ Sorry, something went wrong."
-
-    await update.message.reply_text(response_text, parse_mode="Markdown")
+async def start(update, context):
+    await update.message.reply_text(
+        WELCOME_MESSAGE, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True
+    )
 
 # --- Main bot runner ---
-async def run_telegram_polling():
+def run_telegram_polling():
+    """Build the bot and block in run_polling, which owns the event loop."""
     logger.info("🚀 Starting Smart Planner Bot (polling mode)...")
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not token:
         raise RuntimeError("TELEGRAM_BOT_TOKEN not set")
 
-    app = Application.builder().token(token).build()
+    from app.utils.telegram_bot import build_application
+    # Same message path as the webhook router: per-chat lock, the blocking turn
+    # in a worker thread, and memory updates persisted after each reply.
+    from app.routers.telegram import handle_message
+
+    app = build_application(token)
     app.add_handler(CommandHandler("start", start))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
     logger.info("🤖 Bot is running. Press Ctrl+C to stop.")
-    await app.run_polling()
+    app.run_polling(allowed_updates=[Update.MESSAGE])
 
 def main():
     print("🤖 Smart Personal Planner - Telegram Bot Testing")
@@ -99,8 +87,7 @@ def main():
     input("Press Enter when ready to start the bot...")
 
     try:
-        import asyncio
-        asyncio.run(run_telegram_polling())
+        run_telegram_polling()
     except KeyboardInterrupt:
         print("\n✅ Bot stopped by user")
         return 0
@@ -4,6 +4,7 @@ Minimal Telegram bot in webhook mode using FastAPI + python-telegram-bot v20.
 """
 
 import os
+import sys
 import logging
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
@@ -11,6 +12,12 @@ from fastapi import FastAPI, Request
 import telegram
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from app.utils.telegram_bot import build_request  # noqa: E402
+
 load_dotenv()
 
 logging.basicConfig(
@@ -25,7 +32,12 @@ if not BOT_TOKEN:
     raise RuntimeError("TELEGRAM_BOT_TOKEN not set in .env")
 
 # Create PTB application
-application = Application.builder().token(BOT_TOKEN).build()
+application = (
+    Application.builder()
+    .token(BOT_TOKEN)
+    .request(build_request())
+    .build()
+)
 
 # Handlers
 async def start(update, _context):
@@ -48,7 +60,7 @@ async def lifespan(app: FastAPI):
     await application.start()
     if WEBHOOK_URL:
         logger.info(f"🔗 Setting webhook to {WEBHOOK_URL}")
-        await application.bot.set_webhook(WEBHOOK_URL)
+        await application.bot.set_webhook(WEBHOOK_URL, allowed_updates=[telegram.Update.MESSAGE])
     yield
 
 app = FastAPI(lifespan=lifespan)
@@ -57,5 +69,6 @@ app = FastAPI(lifespan=lifespan)
 async def telegram_webhook(request: Request):
     data = await request.json()
     update = telegram.Update.de_json(data, application.bot)
-    await application.process_update(update)
+    # Hand off to the queue consumed by application.start() and ack right away
+    application.update_queue.put_nowait(update)
     return {"ok": True}
@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# Make `app` importable when pytest is run as `pytest tests_curated` (not only
+# `python -m pytest`), without per-file sys.path hacks.
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
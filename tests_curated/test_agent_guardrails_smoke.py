@@ -1,13 +1,24 @@
-import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv(override=False)
-os.environ.setdefault("PLANNING_USE_REACT_AGENT", "true")
-os.environ.setdefault("PLANNING_USE_LLM_TOOLS", "true")
 
-from app.cognitive.agents.react_agent import create_planning_react_agent
+# One pass over the policy prompt collects every QC marker we check for
+_QC_MARKERS = re.compile(
+    r"GrammarValidator|grammar_validator"
+    r"|ontology_snapshot"
+    r"|semantic_critic"
+    r"|qc_decision"
+    r'|Only proceed when qc_action="accept"'
+)
+
+def test_guardrails_present(monkeypatch):
+    monkeypatch.setenv("PLANNING_USE_REACT_AGENT", "true")
+    monkeypatch.setenv("PLANNING_USE_LLM_TOOLS", "true")
+
+    # Imported here so collection doesn't pay for building the agent stack
+    from app.cognitive.agents.react_agent import create_planning_react_agent
 
-def test_guardrails_present():
     graph, cfg = create_planning_react_agent()
     # Access tool names from the graph’s tool registry if exposed
     # Fallback: recreate the tool list via factory method if available
@@ -25,8 +36,11 @@ def test_policy_prompt_contains_qc_sequence():
     from app.cognitive.contracts.types import InteractionPolicy
 
     prompt = create_policy_aware_system_prompt(InteractionPolicy())
-    assert "GrammarValidator" in prompt or "grammar_validator" in prompt
-    assert "ontology_snapshot" in prompt
-    assert "semantic_critic" in prompt
-    assert "qc_decision" in prompt
-    assert "Only proceed when qc_action=\"accept\"" in prompt
\ No newline at end of file
+    found = set(_QC_MARKERS.findall(prompt))
+    assert found & {"GrammarValidator", "grammar_validator"}
+    assert {
+        "ontology_snapshot",
+        "semantic_critic",
+        "qc_decision",
+        'Only proceed when qc_action="accept"',
+    } <= found
\ No newline at end of file
@@ -0,0 +1,64 @@
+import pytest
+
+from app.cognitive.brain.intent_registry_routes import (
+    AGENTIC_FLOW_REGISTRY,
+    FALLBACK_FLOW_REGISTRY,
+    get_flow_registry,
+)
+from app.config.feature_flags import get_flag, is_fallback_mode_enabled
+
+@pytest.mark.parametrize(
+    "mode,fallback,expected",
+    [("false", False, AGENTIC_FLOW_REGISTRY), ("true", True, FALLBACK_FLOW_REGISTRY)],
+    ids=["agentic", "fallback"],
+)
+def test_get_flow_registry(monkeypatch, mode, fallback, expected):
+    monkeypatch.setenv("PLANNING_FALLBACK_MODE", mode)
+    assert is_fallback_mode_enabled() is fallback
+    assert get_flow_registry() == expected
+
+
+def test_get_flag_reads_environment_at_call_time(monkeypatch):
+    monkeypatch.setenv("PLANNING_USE_LLM_TOOLS", "true")
+    assert get_flag("PLANNING_USE_LLM_TOOLS") is True
+    monkeypatch.setenv("PLANNING_USE_LLM_TOOLS", "false")
+    assert get_flag("PLANNING_USE_LLM_TOOLS") is False
+    assert get_flag("UNKNOWN_FLAG", "default") == "default"
+
+
+# Flow invariants declared once: exact agentic flow, minimum fallback length,
+# and nodes every fallback flow must run, listed in the order they must run.
+# Flows are ordered node sequences; a node tuple below must appear in the flow
+# in that relative order (other nodes may sit in between).
+_PLAN_FALLBACK_MUST = ("plan_outline_node_legacy", "task_generation_node", "persistence_node")
+_CONFIRMED_PLAN_FALLBACK_MUST = ("plan_outline_node_legacy", "user_confirm_a_node", "task_generation_node", "persistence_node")
+_TASK_FALLBACK_MUST = ("validation_node", "user_confirm_b_node", "persistence_node")
+EXPECTED = {
+    "create_new_plan": {"agentic": ("planning_node",), "fallback_min": 6, "fallback_must": _CONFIRMED_PLAN_FALLBACK_MUST},
+    "revise_plan": {"agentic": ("planning_node",), "fallback_min": 6, "fallback_must": _CONFIRMED_PLAN_FALLBACK_MUST},
+    "adaptive_replan": {"agentic": ("planning_node",), "fallback_min": 6, "fallback_must": _PLAN_FALLBACK_MUST},
+    "update_task": {"agentic": ("update_task_node", "persistence_node"), "fallback_min": 4, "fallback_must": _TASK_FALLBACK_MUST},
+    "reschedule_task": {"agentic": ("reschedule_task_node", "persistence_node"), "fallback_min": 4, "fallback_must": _TASK_FALLBACK_MUST},
+    "remove_task": {"agentic": ("remove_task_node", "persistence_node"), "fallback_min": 4, "fallback_must": _TASK_FALLBACK_MUST},
+}
+
+
+def test_flow_registry_invariants():
+    for intent, spec in EXPECTED.items():
+        agentic, fallback = AGENTIC_FLOW_REGISTRY[intent], FALLBACK_FLOW_REGISTRY[intent]
+        assert agentic == spec["agentic"], intent
+        assert len(fallback) >= spec["fallback_min"], intent
+        assert set(fallback).issuperset(spec["fallback_must"]), intent
+        positions = [fallback.index(node) for node in spec["fallback_must"]]
+        assert positions == sorted(positions), intent
+        assert fallback[-1] == "persistence_node", intent
+        # Fallback flows are fully deterministic and never route through planning_node
+        assert "planning_node" not in fallback, intent
+
+
+@pytest.mark.parametrize("registry", [AGENTIC_FLOW_REGISTRY, FALLBACK_FLOW_REGISTRY], ids=["agentic", "fallback"])
+def test_flow_registries_are_read_only(registry):
+    assert registry["create_new_plan"][0] in {"planning_node", "plan_outline_node_legacy"}
+    assert all(isinstance(nodes, tuple) for nodes in registry.values())
+    with pytest.raises(TypeError):
+        registry["create_new_plan"] = ("planning_node",)
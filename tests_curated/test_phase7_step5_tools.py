@@ -0,0 +1,164 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.cognitive.agents.planning_tools import (
+    _detect_conflicts_sweep,
+    PortfolioProbeInput,
+    PortfolioProbeTool,
+    RoadmapBuilderInput,
+    RoadmapBuilderTool,
+    ScheduleGeneratorInput,
+    ScheduleGeneratorTool,
+)
+from app.cognitive.contracts.types import (
+    PlanContext,
+    PlanNode,
+    PlanOutline,
+    Roadmap,
+    Schedule,
+    StrategyProfile,
+)
+
+# The tools are deterministic, so the outline → roadmap → schedule chain is
+# built once per session and every test only asserts on the shared artifacts.
+# No assertion depends on fresh ids or the current time, so they are fixed here.
+_ROOT_ID = uuid4()
+_TASK_ID = uuid4()
+_START = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _outline_fields(root_id, task_id) -> dict:
+    return {
+        "root_id": root_id,
+        "plan_context": {"strategy_profile": {"mode": "push"}},
+        "nodes": [
+            {"id": root_id, "node_type": "goal", "level": 1, "title": "Run a 10k"},
+            {"id": task_id, "parent_id": root_id, "node_type": "task", "level": 2, "title": "Easy 5k run"},
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def outline() -> PlanOutline:
+    # Trusted literal data: build with model_construct and skip validation;
+    # test_outline_fixture_data_is_valid keeps the schema honest.
+    nodes = [
+        PlanNode.model_construct(id=_ROOT_ID, node_type="goal", level=1, title="Run a 10k"),
+        PlanNode.model_construct(id=_TASK_ID, parent_id=_ROOT_ID, node_type="task", level=2, title="Easy 5k run"),
+    ]
+    return PlanOutline.model_construct(
+        root_id=_ROOT_ID,
+        plan_context=PlanContext.model_construct(strategy_profile=StrategyProfile.model_construct(mode="push")),
+        nodes=nodes,
+    )
+
+
+@pytest.fixture(scope="session")
+def outline_json(outline: PlanOutline) -> bytes:
+    return outline.model_dump_json().encode()
+
+
+@pytest.fixture(scope="session")
+def built_roadmap(outline: PlanOutline):
+    res = RoadmapBuilderTool().run_from_outline(outline)
+    assert res.ok, res.explanations
+    roadmap = Roadmap.model_validate(res.data["roadmap"])
+    return roadmap, roadmap.model_dump(mode="json")
+
+
+@pytest.fixture(scope="session")
+def built_schedule(built_roadmap):
+    roadmap, _ = built_roadmap
+    res = ScheduleGeneratorTool().run_from_roadmap(roadmap, start_time=_START)
+    assert res.ok, res.explanations
+    schedule = Schedule.model_validate(res.data["schedule"])
+    return schedule, schedule.model_dump(mode="json")
+
+
+class TestPlanningPipeline:
+    """Staged outline → roadmap → schedule → probe checks over the shared artifacts."""
+
+    def test_roadmap_ok(self, outline, built_roadmap):
+        roadmap, _ = built_roadmap
+        assert roadmap.root_id == outline.root_id
+        assert [n.id for n in roadmap.nodes] == [n.id for n in outline.nodes]
+
+    def test_schedule_ok(self, outline, built_schedule):
+        schedule, _ = built_schedule
+        task_ids = {n.id for n in outline.nodes if n.node_type == "task"}
+        assert schedule.blocks
+        assert {b.plan_node_id for b in schedule.blocks} == task_ids
+        assert schedule.blocks[0].start == _START
+
+    def test_probe_ok(self, built_schedule):
+        schedule, schedule_dump = built_schedule
+        res = PortfolioProbeTool().run_from_schedule(schedule)
+        assert res.ok
+        assert res.data["conflicts"] == []
+        assert res.data["utilization_minutes"] == sum(b["estimated_minutes"] for b in schedule_dump["blocks"])
+
+
+def test_run_delegates_to_fast_path(outline, built_roadmap, built_schedule):
+    _, roadmap_dump = built_roadmap
+    _, schedule_dump = built_schedule
+    res = RoadmapBuilderTool().run(RoadmapBuilderInput(outline=outline.model_dump(mode="json")))
+    assert res.ok
+    assert res.data["roadmap"] == RoadmapBuilderTool().run_from_outline(outline).data["roadmap"]
+    assert res.data["roadmap"]["root_id"] == roadmap_dump["root_id"]
+    res = ScheduleGeneratorTool().run(ScheduleGeneratorInput(roadmap=roadmap_dump, start_time=_START))
+    assert res.ok
+    assert [b["plan_node_id"] for b in res.data["schedule"]["blocks"]] == [
+        b["plan_node_id"] for b in schedule_dump["blocks"]
+    ]
+    res = PortfolioProbeTool().run(PortfolioProbeInput(schedule=schedule_dump))
+    assert res.ok
+    assert res.data["conflicts"] == []
+
+
+def test_tool_results_are_json_safe(built_roadmap):
+    roadmap, _ = built_roadmap
+    res = ScheduleGeneratorTool().run_from_roadmap(roadmap, start_time=_START)
+    # run_from_* dumps models in JSON mode, so no UUID/datetime objects leak into ToolResult.data
+    assert json.loads(json.dumps(res.data)) == res.data
+
+
+def test_roadmap_builder_run_json(outline_json, built_roadmap):
+    roadmap, _ = built_roadmap
+    res = RoadmapBuilderTool().run_json(outline_json)
+    assert res.ok
+    assert Roadmap.model_validate(res.data["roadmap"]).root_id == roadmap.root_id
+
+
+def test_roadmap_builder_run_json_rejects_invalid_payload():
+    res = RoadmapBuilderTool().run_json(b'{"root_id": "not-a-uuid"}')
+    assert not res.ok
+    assert res.explanations[0].startswith("roadmap_builder_error")
+
+
+def test_outline_fixture_data_is_valid(outline):
+    validated = PlanOutline.model_validate(_outline_fields(_ROOT_ID, _TASK_ID))
+    assert validated.model_dump() == outline.model_dump()
+
+
+def _block(node_id, start_min, end_min):
+    return {
+        "plan_node_id": node_id,
+        "start": (_START + timedelta(minutes=start_min)).isoformat(),
+        "end": _START + timedelta(minutes=end_min),
+    }
+
+
+def test_detect_conflicts_sweep_reports_each_overlapping_pair():
+    blocks = [_block("c", 90, 120), _block("a", 0, 60), _block("b", 30, 100), _block("d", 120, 180)]
+    conflicts = _detect_conflicts_sweep(blocks)
+    assert conflicts == [
+        {"plan_node_ids": ["a", "b"], "overlap_minutes": 30},
+        {"plan_node_ids": ["b", "c"], "overlap_minutes": 10},
+    ]
+
+
+def test_detect_conflicts_sweep_back_to_back_blocks_do_not_conflict():
+    assert _detect_conflicts_sweep([_block(str(i), i * 60, (i + 1) * 60) for i in range(500)]) == []
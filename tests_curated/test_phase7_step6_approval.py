@@ -0,0 +1,27 @@
+import pytest
+
+from app.cognitive.agents.planning_tools import ApprovalHandlerInput, ApprovalHandlerTool
+
+
+@pytest.fixture(scope="module")
+def tool() -> ApprovalHandlerTool:
+    return ApprovalHandlerTool()
+
+
+@pytest.mark.parametrize(
+    "policy,rfc_required,kwargs,expected",
+    [
+        ("single_final", False, {}, "approved"),
+        ("milestone_approvals", False, {"user_feedback": "Approve"}, "approved"),
+        ("single_final", True, {"pattern_rfc_text": "New subtype: couch_to_10k"}, "pending"),
+    ],
+    ids=["auto_approve", "user_approves", "rfc_pending"],
+)
+def test_approval_handler(tool, policy, rfc_required, kwargs, expected):
+    params = ApprovalHandlerInput(approval_policy=policy, pattern_rfc_required=rfc_required, **kwargs)
+    res = tool.run(params)
+    assert res.ok
+    assert res.data["decision"] == expected
+    if expected == "pending":
+        assert "new subtype" in res.data["cta"]
+        assert res.data["rfc"] == kwargs["pattern_rfc_text"]
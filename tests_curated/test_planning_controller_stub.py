@@ -0,0 +1,54 @@
+import pytest
+
+from app.cognitive.state.graph_state import GraphState
+
+
+def test_planning_controller_smoke_runs(monkeypatch):
+    monkeypatch.setenv("SMART_PLANNER_TEST_STUB", "1")
+
+    # Imported here so collection doesn't pay for building the agent stack
+    from app.cognitive.agents.planning_controller import PlanningController
+
+    state = PlanningController().run(GraphState(user_input="Plan a 10k training block"))
+
+    assert state.response_text == "Agent skipped (stub mode)."
+    assert state.planning_trace[-1]["event"] == "stub_mode"
+
+
+def test_planning_controller_missing_input_short_circuits(monkeypatch):
+    monkeypatch.setenv("SMART_PLANNER_TEST_STUB", "1")
+
+    from app.cognitive.agents.planning_controller import PlanningController
+
+    state = PlanningController().run(GraphState(user_input=None))
+
+    assert state.planning_status == "needs_clarification"
+    assert state.planning_trace[-1]["event"] == "missing_user_input"
+
+
+class _RecordingGraph:
+    def __init__(self):
+        self.config = None
+
+    def invoke(self, messages_state, config=None):
+        self.config = config
+        return {"messages": [{"role": "assistant", "content": "ok"}]}
+
+
+@pytest.mark.parametrize("max_steps,expected", [(None, 25), (12, 12)], ids=["default", "capped"])
+def test_planning_controller_max_steps_sets_recursion_limit(monkeypatch, max_steps, expected):
+    monkeypatch.delenv("SMART_PLANNER_TEST_STUB", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    from app.cognitive.agents import planning_controller
+
+    graph = _RecordingGraph()
+    cfg = {"config": {"recursion_limit": 25, "configurable": {}}}
+    monkeypatch.setattr(planning_controller, "create_planning_react_agent", lambda **_: (graph, cfg))
+
+    state = planning_controller.PlanningController().run(
+        GraphState(user_input="Plan a 10k training block"), max_steps=max_steps
+    )
+
+    assert state.response_text == "ok"
+    assert graph.config["recursion_limit"] == expected
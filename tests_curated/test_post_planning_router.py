@@ -0,0 +1,24 @@
+import pytest
+
+from app.cognitive.state.graph_state import GraphState
+from app.flow.router import route_after_planning_result
+
+STATUSES = [
+    ("complete", "to_world_model"),
+    ("needs_clarification", "to_planning_loop"),
+    ("needs_scheduling_escalation", "to_scheduling_escalation"),
+    ("aborted", "to_summary_or_end"),
+]
+
+# Literal, trusted inputs: build each state once and skip validation
+_STATES = {status: GraphState.model_construct(planning_status=status) for status, _ in STATUSES}
+
+
+@pytest.mark.parametrize("status,expected", STATUSES)
+def test_route_after_planning_result(status, expected):
+    assert route_after_planning_result(_STATES[status]) == expected
+
+
+def test_route_defaults_to_summary_without_status():
+    state = GraphState.model_construct(planning_status=None)
+    assert route_after_planning_result(state) == "to_summary_or_end"
@@ -0,0 +1,101 @@
+import pytest
+
+from app.utils import response_cache as rc
+from app.utils.response_cache import ResponseCache, is_cacheable, make_key, normalize_prompt
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_normalize_prompt_ignores_case_punctuation_and_spacing():
+    assert normalize_prompt("  Show me   my PLANS?! ") == "show me my plans"
+    assert make_key(1, "Show me my plans") == make_key(1, "show me my plans?")
+    assert make_key(1, "show me my plans") != make_key(2, "show me my plans")
+
+
+@pytest.mark.parametrize(
+    "response,expected",
+    [
+        ("Your weekly summary looks good.", True),
+        ("Next run is on 2025-01-31.", False),
+        ("Due 31/01/2025", False),
+        ("Due 1.2.25", False),
+        ("", False),
+    ],
+)
+def test_is_cacheable_skips_dates(response, expected):
+    assert is_cacheable(response) is expected
+
+
+def test_get_returns_cached_response_for_normalized_prompt(clock):
+    cache = ResponseCache(clock=clock)
+    cache.put(1, "Show me my plans", "You have 2 plans.")
+    assert cache.get(1, "show me my plans?") == "You have 2 plans."
+    assert cache.get(2, "show me my plans") is None
+
+
+def test_responses_with_dates_are_not_stored(clock):
+    cache = ResponseCache(clock=clock)
+    cache.put(1, "when is my run", "Your run is on 2025-01-31.")
+    assert len(cache) == 0
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl_sec=10, clock=clock)
+    cache.put(1, "summary", "All on track.")
+    clock.now += 9
+    assert cache.get(1, "summary") == "All on track."
+    clock.now += 2
+    assert cache.get(1, "summary") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_entries=2, clock=clock)
+    cache.put(1, "a", "A")
+    cache.put(1, "b", "B")
+    assert cache.get(1, "a") == "A"  # "b" is now least recently used
+    cache.put(1, "c", "C")
+    assert len(cache) == 2
+    assert cache.get(1, "b") is None
+    assert cache.get(1, "a") == "A"
+    assert cache.get(1, "c") == "C"
+
+
+def test_invalidate_user_only_affects_that_user(clock):
+    cache = ResponseCache(clock=clock)
+    cache.put(1, "summary", "Old summary.")
+    cache.put(2, "summary", "Other user.")
+    cache.invalidate_user(1)
+    assert cache.get(1, "summary") is None
+    assert cache.get(2, "summary") == "Other user."
+    cache.put(1, "summary", "New summary.")
+    assert cache.get(1, "summary") == "New summary."
+
+
+def test_shared_cache_follows_flag_and_invalidation(monkeypatch):
+    monkeypatch.setattr(rc, "_shared_cache", None)
+    monkeypatch.setenv("TELEGRAM_RESPONSE_CACHE", "false")
+    assert rc.get_response_cache() is None
+
+    monkeypatch.setenv("TELEGRAM_RESPONSE_CACHE", "true")
+    cache = rc.get_response_cache()
+    assert cache is rc.get_response_cache()
+    cache.put(1, "summary", "One.")
+    cache.put(2, "summary", "Two.")
+
+    rc.invalidate_cached_responses(1)
+    assert cache.get(1, "summary") is None
+    assert cache.get(2, "summary") == "Two."
+    rc.invalidate_cached_responses()
+    assert len(cache) == 0